@@ -0,0 +1,102 @@
+"""Background agent for the Global Dorm client
+
+Keeps one AsyncGlobalDormClient alive and serves it over a Unix domain
+socket, so repeated `python client.py` runs reuse its warm connection pool,
+DNS cache and response cache instead of rebuilding them on every start.
+
+Run with `python agentd.py [base_url]`, or as a systemd user service
+(see globaldorm-agentd.service).
+"""
+import asyncio
+import contextlib
+import io
+import os
+import signal
+import sys
+
+import orjson
+
+from client import AgentProxy, AsyncGlobalDormClient, agent_socket_path
+
+async def handle_connection(client, lock, reader, writer):
+    """Run one forwarded client operation and reply with its result and output"""
+    try:
+        payload = await reader.read()
+        if not payload:
+            # Availability probe from AgentProxy.available
+            return
+        request = orjson.loads(payload)
+        op = request.get('op')
+
+        if op not in AgentProxy.OPS:
+            reply = {'output': '', 'error': f"Unknown operation: {op}"}
+        else:
+            # One operation at a time so captured output never interleaves
+            async with lock:
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    try:
+                        result = await getattr(client, op)(*request.get('args', []), **request.get('kwargs', {}))
+                        reply = {'result': result}
+                    except Exception as e:
+                        reply = {'error': str(e)}
+                reply['output'] = output.getvalue()
+
+        try:
+            # Room and Application results travel as their JSON layout
+            body = orjson.dumps(reply, default=lambda obj: obj.to_json())
+        except orjson.JSONEncodeError as e:
+            body = orjson.dumps({'output': reply.get('output', ''), 'error': f"Unserialisable result: {e}"})
+        writer.write(body)
+        await writer.drain()
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"Dropped request: {e}", file=sys.stderr)
+    finally:
+        writer.close()
+
+async def serve(base_url, sock_path):
+    """Open the client and accept forwarded operations until cancelled"""
+    async with AsyncGlobalDormClient(base_url) as client:
+        lock = asyncio.Lock()
+        # Create the socket owner-only from the start rather than narrowing it after the bind
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                lambda reader, writer: handle_connection(client, lock, reader, writer),
+                path=sock_path
+            )
+        finally:
+            os.umask(old_umask)
+        print(f"Global Dorm agent listening on {sock_path}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+def main():
+    """Start the agent unless one is already listening"""
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8080"
+    sock_path = agent_socket_path()
+
+    if AgentProxy.available(sock_path):
+        print(f"An agent is already listening on {sock_path}", file=sys.stderr)
+        sys.exit(1)
+    with contextlib.suppress(FileNotFoundError):
+        if os.lstat(sock_path).st_uid != os.getuid():
+            print(f"{sock_path} belongs to another user; set XDG_RUNTIME_DIR to a private directory",
+                  file=sys.stderr)
+            sys.exit(1)
+    # Remove a socket file left behind by an agent that did not shut down cleanly
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(sock_path)
+
+    # systemd stops services with SIGTERM; exit normally so the socket is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        asyncio.run(serve(base_url, sock_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(sock_path)
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,173 @@
+import asyncio
+import aiohttp
+import functools
+import getpass
+import httpx
+import ijson
+import orjson
+import ormsgpack
+import os
 import requests
-import json
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+import urllib3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
+# ------------------------- Value objects -------------------------
+# Rooms and applications are held in fixed-layout __slots__ objects rather than
+# nested dicts: much smaller per instance and faster attribute access.
+# Fields missing from a response, e.g. one projected with _ROOM_SUMMARY_FIELDS,
+# are None; the client's format_* methods show them as n/a.
+
+class Room:
+    """A room listing from the orchestrator"""
+    __slots__ = ('id', 'name', 'city', 'postcode', 'price', 'languages', 'details', 'availability_date')
+    
+    @classmethod
+    def from_json(cls, data):
+        """Build a Room from a decoded room object"""
+        room = cls.__new__(cls)
+        location = data.get('location') or {}
+        room.id = data.get('id')
+        room.name = data.get('name')
+        room.city = location.get('city')
+        room.postcode = location.get('postcode')
+        room.price = data.get('price_per_month_gbp')
+        room.languages = data.get('spoken_languages')
+        room.details = data.get('details')
+        room.availability_date = data.get('availability_date')
+        return room
+    
+    def to_json(self):
+        """Return the room as a dict in the orchestrator's JSON layout"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'location': {'city': self.city, 'postcode': self.postcode},
+            'price_per_month_gbp': self.price,
+            'spoken_languages': self.languages,
+            'details': self.details,
+            'availability_date': self.availability_date
+        }
+
+class Application:
+    """A user's application for a room"""
+    __slots__ = ('id', 'status', 'room', 'application_date', 'cancelled_date')
+    
+    @classmethod
+    def from_json(cls, data):
+        """Build an Application, and the Room it is for, from a decoded application object"""
+        app = cls.__new__(cls)
+        room = data.get('room_details')
+        app.id = data.get('id')
+        app.status = data.get('status')
+        app.room = Room.from_json(room) if room else None
+        app.application_date = data.get('application_date')
+        app.cancelled_date = data.get('cancelled_date')
+        return app
+    
+    def to_json(self):
+        """Return the application as a dict in the orchestrator's JSON layout"""
+        return {
+            'id': self.id,
+            'status': self.status,
+            'room_details': self.room.to_json() if self.room is not None else None,
+            'application_date': self.application_date,
+            'cancelled_date': self.cancelled_date
+        }
+
+# ------------------------- Clients -------------------------
+
 class GlobalDormClient:
+    # Seconds a successful GET response is served from cache, by endpoint prefix
+    _CACHE_TTL = {'/api/distance': 86400, '/api/weather': 1800, '/api/rooms': 60}
+    _CACHE_MAX_ENTRIES = 512
+    # Keep-alive connections opened at startup so early requests skip the handshake
+    _WARM_CONNECTIONS = 4
+    
+    # Display templates, filled from a flattened room dict in one format_map call
+    _ROOM_TMPL = (
+        "\nRoom {id}: {name}\n"
+        "  Location: {city}, {postcode}\n"
+        "  Price: £{price_per_month_gbp}/month\n"
+        "  Languages: {languages}\n"
+    )
+    _ROOM_DETAIL_TMPL = _ROOM_TMPL + (
+        "  Furnished: {furnished}\n"
+        "  Shared with: {shared_with} people\n"
+        "  Live-in landlord: {live_in_landlord}\n"
+        "  Bills included: {bills_included}\n"
+        "  Bathroom: {bathroom}\n"
+        "  Amenities: {amenities}\n"
+        "  Available from: {availability_date}\n"
+    )
+    _YN = ('No', 'Yes')
+    _BATHROOM = ('Private', 'Shared')
+    # Shown in place of fields the orchestrator left out
+    _MISSING = 'n/a'
+    
+    # Fields the summary displays need; list requests ask the orchestrator for only these
+    _ROOM_SUMMARY_FIELDS = 'id,name,location.city,location.postcode,price_per_month_gbp,spoken_languages'
+    _APPLICATION_SUMMARY_FIELDS = ('id,status,room_details.name,room_details.location.city,'
+                                   'room_details.price_per_month_gbp,application_date,cancelled_date')
+    
+    # Prefer binary MessagePack bodies; streamed list requests stay on JSON for ijson
+    _ACCEPT = 'application/msgpack, application/json;q=0.9'
+    _STREAM_HEADERS = {'Accept': 'application/json'}
+    _DECODE_ERRORS = (orjson.JSONDecodeError, ormsgpack.MsgpackDecodeError)
+    
     def __init__(self, base_url="http://localhost:8080"):
         """Initialize client session and check service availability"""
         self.base_url = base_url.rstrip('/')
+        self._cache = OrderedDict()
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': self._ACCEPT,
+            'Connection': 'keep-alive',
+            # Every codec urllib3 can decode here: br and zstd too when their packages are installed
+            'Accept-Encoding': urllib3.util.make_headers(accept_encoding=True)['accept-encoding']
         })
         
-        # Test connection to orchestrator service
-        if not self.test_connection():
-            print("Warning: Could not connect to the Global Dorm service")
-            print(f"Make sure the service is running at {base_url}")
+        # Larger connection pool so concurrent callers reuse sockets instead of
+        # opening new ones, plus retries with backoff on transient gateway errors
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                      allowed_methods=['GET', 'POST', 'DELETE'], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, pool_block=False, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Session methods by HTTP verb, bound once so make_request is a single lookup
+        self._dispatch = {
+            'GET': self.session.get,
+            'POST': self.session.post,
+            'DELETE': self.session.delete
+        }
+        
+        # Warm up the connection pool in the background so startup doesn't wait on the network;
+        # the result doubles as the reachability check, reported by the first request
+        self._background = ThreadPoolExecutor(1)
+        self._warm_up_pending = self._background.submit(self.warm_up)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Close the session and release its pooled connections"""
+        self._background.shutdown(cancel_futures=True)
+        self.session.close()
     
     def test_connection(self):
         """Check if the orchestrator service is reachable"""
@@ -25,65 +177,263 @@ class GlobalDormClient:
         except requests.RequestException:
             return False
     
+    def warm_up(self, connections=None):
+        """Resolve the host and open pooled keep-alive connections ahead of real requests
+        
+        Returns how many probes succeeded; 0 means the service is unreachable.
+        """
+        connections = connections or self._WARM_CONNECTIONS
+        try:
+            # Fail fast on an unknown host instead of timing out every probe
+            socket.gethostbyname(urlparse(self.base_url).hostname)
+        except (OSError, TypeError):
+            return 0
+        
+        # Concurrent probes each need their own socket, so the pool ends up holding all of them
+        with ThreadPoolExecutor(connections) as executor:
+            return sum(executor.map(self._probe_connection, range(connections)))
+    
+    def _probe_connection(self, _):
+        """Send a cheap HEAD request to open one pooled connection"""
+        try:
+            response = self.session.head(f"{self.base_url}/api/health", timeout=2)
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+    
+    def _check_warm_up(self):
+        """Report once how many connections the background warm-up opened, or warn if none
+        
+        Never waits: while the warm-up is still running the request goes ahead
+        and the warm-up is checked again by the next request.
+        """
+        pending = self._warm_up_pending
+        if pending is None or not pending.done():
+            return
+        self._warm_up_pending = None
+        if pending.cancelled():
+            return
+        warmed = pending.result()
+        if warmed:
+            print(f"Warmed {warmed} connection(s) to {self.base_url}")
+        else:
+            print("Warning: Could not connect to the Global Dorm service")
+            print(f"Make sure the service is running at {self.base_url}")
+    
     def make_request(self, method, endpoint, data=None, params=None):
         """Generic HTTP request method with error handling"""
+        self._check_warm_up()
+        verb = method if method in self._dispatch else method.upper()
+        send = self._dispatch.get(verb)
+        if send is None:
+            print(f"Unsupported HTTP method: {method}")
+            return None
+        
+        cache_key = self._cache_key(endpoint, params) if verb == 'GET' else None
+        stale = None
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            stale = self._cache_validator(cache_key)
+        
         try:
             url = f"{self.base_url}{endpoint}"
+            kwargs = {'params': params, 'timeout': 10}
+            if verb != 'GET':
+                # Serialise with orjson and send raw bytes rather than letting requests use stdlib json
+                kwargs['data'] = orjson.dumps(data) if data is not None else None
+            elif stale is not None:
+                kwargs['headers'] = {'If-None-Match': stale[1]}
+            response = send(url, **kwargs)
             
-            if method.upper() == 'GET':
-                response = self.session.get(url, params=params, timeout=10)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, params=params, timeout=10)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url, json=data, params=params, timeout=10)
-            else:
-                print(f"Unsupported HTTP method: {method}")
-                return None
-            
-            if response.status_code == 200:
-                return response.json()
+            if response.status_code == 304 and stale is not None:
+                # Unchanged on the server: reuse the cached body without downloading or parsing it
+                self._cache_put(cache_key, *stale)
+                return stale[0]
+            elif response.status_code == 200:
+                result = self._decode(response)
+                if cache_key is not None:
+                    self._cache_put(cache_key, result, response.headers.get('ETag'))
+                return result
             else:
                 # Attempt to print server-provided error message
-                error_data = response.json() if response.content else {}
+                error_data = self._decode(response) if response.content else {}
                 print(f"Request failed ({response.status_code}): {error_data.get('message', 'Unknown error')}")
                 return None
                 
         except requests.RequestException as e:
             print(f"Network error: {e}")
             return None
-        except json.JSONDecodeError:
+        except self._DECODE_ERRORS:
+            print("Invalid response from server")
+            return None
+    
+    @staticmethod
+    def _decode(response, content=None):
+        """Decode a response body as MessagePack or JSON according to its Content-Type"""
+        content = response.content if content is None else content
+        if 'msgpack' in response.headers.get('Content-Type', ''):
+            return ormsgpack.unpackb(content)
+        return orjson.loads(content)
+    
+    def iter_request(self, endpoint, params=None, item_path='item', wrap=None):
+        """Stream a GET response and return an iterator over the JSON array at item_path
+        
+        Items are parsed incrementally as they arrive, so callers can display
+        the first result before the whole body has downloaded. wrap, e.g.
+        Room.from_json, turns each item into the object that is yielded and
+        cached, so the raw dict is not kept alongside it. Returns None if the
+        request fails.
+        """
+        self._check_warm_up()
+        cache_key = self._cache_key(endpoint, params) + (item_path, wrap)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return iter(cached)
+        stale = self._cache_validator(cache_key)
+        headers = {**self._STREAM_HEADERS, 'If-None-Match': stale[1]} if stale is not None else self._STREAM_HEADERS
+        
+        try:
+            url = f"{self.base_url}{endpoint}"
+            response = self.session.get(url, params=params, headers=headers, stream=True, timeout=10)
+            if response.status_code == 304 and stale is not None:
+                # Unchanged on the server: replay the cached items
+                response.close()
+                self._cache_put(cache_key, *stale)
+                return iter(stale[0])
+            if response.status_code != 200:
+                # Attempt to print server-provided error message
+                error_data = orjson.loads(response.content) if response.content else {}
+                response.close()
+                print(f"Request failed ({response.status_code}): {error_data.get('message', 'Unknown error')}")
+                return None
+        
+        except requests.RequestException as e:
+            print(f"Network error: {e}")
+            return None
+        except orjson.JSONDecodeError:
+            print("Invalid JSON response from server")
+            return None
+        
+        return self._iter_items(response, item_path, cache_key, wrap)
+    
+    def _iter_items(self, response, item_path, cache_key, wrap):
+        """Yield array items from a streamed response, caching them once fully read"""
+        items = []
+        try:
+            with response:
+                # Let urllib3 undo any Content-Encoding before the bytes reach ijson
+                response.raw.decode_content = True
+                for item in ijson.items(response.raw, item_path, use_float=True):
+                    if wrap is not None:
+                        item = wrap(item)
+                    items.append(item)
+                    yield item
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            print(f"Network error: {e}")
+            return
+        except ijson.JSONError:
             print("Invalid JSON response from server")
+            return
+        self._cache_put(cache_key, items, response.headers.get('ETag'))
+    
+    # ------------------------- Response cache -------------------------
+    
+    def _cache_key(self, endpoint, params):
+        """Build a cache key that ignores the order of query parameters"""
+        return (endpoint, tuple(sorted((params or {}).items())))
+    
+    def _cache_ttl(self, endpoint):
+        """Return the cache lifetime in seconds for an endpoint (0 = not cached)"""
+        for prefix, ttl in self._CACHE_TTL.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return 0
+    
+    def _cache_get(self, key):
+        """Return a cached response if it is still fresh, otherwise None"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value, etag = entry
+        if time.monotonic() - stored_at < self._cache_ttl(key[0]):
+            self._cache.move_to_end(key)
+            return value
+        if etag is None:
+            # Nothing left to revalidate against the server
+            del self._cache[key]
+        return None
+    
+    def _cache_validator(self, key):
+        """Return (value, etag) for a stale entry the server can revalidate, otherwise None"""
+        entry = self._cache.get(key)
+        if entry is None or entry[2] is None:
             return None
+        return entry[1], entry[2]
+    
+    def _cache_put(self, key, value, etag=None):
+        """Store a response, evicting the least recently used entry when full
+        
+        Entries with an ETag are kept even when the endpoint has no TTL, so the
+        next request can revalidate them with If-None-Match.
+        """
+        if self._cache_ttl(key[0]) <= 0 and etag is None:
+            return
+        self._cache[key] = (time.monotonic(), value, etag)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
+    def invalidate(self, endpoint_prefix):
+        """Drop cached responses for endpoints starting with endpoint_prefix"""
+        for key in [key for key in self._cache if key[0].startswith(endpoint_prefix)]:
+            del self._cache[key]
+    
+    def _invalidate_applications(self, *user_ids):
+        """Drop cached rooms and user applications after an application changes"""
+        self.invalidate('/api/rooms')
+        for user_id in user_ids:
+            # A malformed bulk item may have no user id
+            if user_id is not None:
+                self.invalidate(f'/api/users/{user_id}/')
     
     # ------------------------- Room-related methods -------------------------
     
-    def search_rooms(self, filters=None):
-        """Search for rooms using optional filters"""
+    def search_rooms(self, filters=None, details=False):
+        """Search for rooms using optional filters, optionally fetching full details in one bulk request"""
         print("\nSearching for rooms...")
-        response = self.make_request('GET', '/api/rooms', params=filters)
-        
-        if response and response.get('success'):
-            rooms = response.get('rooms', [])
-            total = response.get('total', 0)
-            print(f"Found {total} room(s)")
-            for room in rooms:
-                self.display_room(room)
-            return rooms
-        else:
+        # Full details come from the bulk request, so a detailed search only needs ids
+        params = {**(filters or {}), 'fields': 'id' if details else self._ROOM_SUMMARY_FIELDS}
+        rooms = self.iter_request('/api/rooms', params=params, item_path='rooms.item',
+                                  wrap=Room.from_json)
+        if rooms is None:
             print("Failed to search rooms")
             return []
+        if details:
+            room_ids = [room.id for room in rooms]
+            print(f"Found {len(room_ids)} room(s)")
+            return self.get_rooms_bulk(room_ids) if room_ids else []
+        
+        # Display each room as soon as it is parsed off the stream
+        found = []
+        for room in rooms:
+            self.display_room(room)
+            found.append(room)
+        print(f"Found {len(found)} room(s)")
+        return found
     
     def get_room_details(self, room_id):
         """Retrieve detailed info for a specific room"""
         print(f"\nGetting details for room {room_id}...")
         response = self.make_request('GET', f'/api/rooms/{room_id}')
-        if response and response.get('success'):
-            room = response.get('room')
-            self.display_room(room, detailed=True)
-            return room
-        else:
-            print(f"Failed to get room {room_id} details")
-            return None
+        return self._on_room_details(response, room_id)
+    
+    def get_rooms_bulk(self, room_ids):
+        """Retrieve detailed info for several rooms in a single request"""
+        print(f"\nGetting details for {len(room_ids)} room(s)...")
+        response = self.make_request('POST', '/api/rooms/bulk', data={'ids': room_ids})
+        return self._on_rooms_bulk(response)
     
     # ------------------------- Application methods -------------------------
     
@@ -96,40 +446,32 @@ class GlobalDormClient:
             'user_email': user_email
         }
         response = self.make_request('POST', '/api/applications', data=data)
-        if response and response.get('success'):
-            print(f"SUCCESS: {response.get('message')}")
-            print(f"Application ID: {response.get('application_id')}")
-            return True
-        else:
-            print("Failed to apply for room")
-            return False
+        self._invalidate_applications(user_id)
+        return self._on_apply_for_room(response)
+    
+    def apply_for_rooms_bulk(self, applications):
+        """Submit several applications (dicts of room_id, user_id, user_email) in a single request"""
+        print(f"\nApplying for {len(applications)} room(s)...")
+        data = {'applications': applications}
+        response = self.make_request('POST', '/api/applications/bulk', data=data)
+        self._invalidate_applications(*{application.get('user_id') for application in applications})
+        return self._on_apply_for_rooms_bulk(response, applications)
     
     def cancel_application(self, application_id, user_id):
         """Cancel an existing room application"""
         print(f"\nCancelling application {application_id}...")
         data = {'user_id': user_id}
         response = self.make_request('DELETE', f'/api/applications/{application_id}', data=data)
-        if response and response.get('success'):
-            print(f"SUCCESS: {response.get('message')}")
-            return True
-        else:
-            print("Failed to cancel application")
-            return False
+        self._invalidate_applications(user_id)
+        return self._on_cancel_application(response)
     
     def get_user_applications(self, user_id):
         """Retrieve all applications submitted by a user"""
         print(f"\nGetting applications for user {user_id}...")
-        response = self.make_request('GET', f'/api/users/{user_id}/applications')
-        if response and response.get('success'):
-            applications = response.get('applications', [])
-            total = response.get('total', 0)
-            print(f"Found {total} application(s)")
-            for app in applications:
-                self.display_application(app)
-            return applications
-        else:
-            print("Failed to get user applications")
-            return []
+        params = {'fields': self._APPLICATION_SUMMARY_FIELDS}
+        applications = self.iter_request(f'/api/users/{user_id}/applications', params=params,
+                                         item_path='applications.item', wrap=Application.from_json)
+        return self._on_user_applications(applications)
     
     # ------------------------- External service methods -------------------------
     
@@ -138,6 +480,86 @@ class GlobalDormClient:
         print(f"\nCalculating distance from {room_postcode} to {campus_postcode}...")
         params = {'room_postcode': room_postcode, 'campus_postcode': campus_postcode}
         response = self.make_request('GET', '/api/distance', params=params)
+        return self._on_distance(response)
+    
+    def get_weather_forecast(self, postcode):
+        """Retrieve weather forecast for a given postcode"""
+        print(f"\nGetting weather forecast for {postcode}...")
+        params = {'postcode': postcode}
+        response = self.make_request('GET', '/api/weather', params=params)
+        return self._on_weather(response)
+    
+    # ------------------------- Response handlers -------------------------
+    # Shared by the sync and async clients so both report results identically
+    
+    def _on_room_details(self, response, room_id):
+        """Print and return the room from a room details response"""
+        if response and response.get('success'):
+            room = Room.from_json(response['room'])
+            self.display_room(room, detailed=True)
+            return room
+        else:
+            print(f"Failed to get room {room_id} details")
+            return None
+    
+    def _on_rooms_bulk(self, response):
+        """Print and return the rooms from a bulk room details response"""
+        if response and response.get('success'):
+            rooms = [Room.from_json(room) for room in response.get('rooms', [])]
+            self.display_rooms(rooms, detailed=True)
+            return rooms
+        else:
+            print("Failed to get room details")
+            return []
+    
+    def _on_user_applications(self, applications):
+        """Print and return the applications from a user applications stream (None if it failed)"""
+        if applications is None:
+            print("Failed to get user applications")
+            return []
+        
+        # Applications are parsed as they stream in, then printed with one write
+        found = list(applications)
+        print(f"Found {len(found)} application(s)")
+        self.display_applications(found)
+        return found
+    
+    def _on_apply_for_room(self, response):
+        """Report the outcome of a room application"""
+        if response and response.get('success'):
+            print(f"SUCCESS: {response.get('message')}")
+            print(f"Application ID: {response.get('application_id')}")
+            return True
+        else:
+            print("Failed to apply for room")
+            return False
+    
+    def _on_apply_for_rooms_bulk(self, response, applications):
+        """Report the outcome of each application in a bulk submission"""
+        if response and response.get('success'):
+            results = response.get('results', [])
+            for application, result in zip(applications, results):
+                if result.get('success'):
+                    print(f"Room {application.get('room_id')}: SUCCESS: {result.get('message')} "
+                          f"(Application ID: {result.get('application_id')})")
+                else:
+                    print(f"Room {application.get('room_id')}: FAILED: {result.get('message')}")
+            return results
+        else:
+            print("Failed to apply for rooms")
+            return []
+    
+    def _on_cancel_application(self, response):
+        """Report the outcome of an application cancellation"""
+        if response and response.get('success'):
+            print(f"SUCCESS: {response.get('message')}")
+            return True
+        else:
+            print("Failed to cancel application")
+            return False
+    
+    def _on_distance(self, response):
+        """Print and return the distance info from a distance response"""
         if response and response.get('success'):
             distance_info = response.get('distance')
             print(f"Route: {distance_info['from']} to {distance_info['to']}")
@@ -149,11 +571,8 @@ class GlobalDormClient:
             print("Tip: Make sure postcodes are valid UK postcodes (e.g., 'NG2 8PT')")
             return None
     
-    def get_weather_forecast(self, postcode):
-        """Retrieve weather forecast for a given postcode"""
-        print(f"\nGetting weather forecast for {postcode}...")
-        params = {'postcode': postcode}
-        response = self.make_request('GET', '/api/weather', params=params)
+    def _on_weather(self, response):
+        """Print and return the forecast from a weather response"""
         if response and response.get('success'):
             weather_info = response.get('weather')
             print(f"Weather forecast for {weather_info['location']}:")
@@ -168,115 +587,727 @@ class GlobalDormClient:
     
     # ------------------------- Display methods -------------------------
     
+    def format_room(self, room, detailed=False):
+        """Return room summary or detailed information as text"""
+        flat = {
+            'id': room.id,
+            'name': room.name,
+            'city': room.city,
+            'postcode': room.postcode,
+            'price_per_month_gbp': room.price,
+            'languages': self._join(room.languages)
+        }
+        template = self._ROOM_TMPL
+        if detailed:
+            details = room.details or {}
+            yes_no = self._YN
+            flat.update({
+                'furnished': self._label(details.get('furnished'), yes_no),
+                'shared_with': details.get('shared_with'),
+                'live_in_landlord': self._label(details.get('live_in_landlord'), yes_no),
+                'bills_included': self._label(details.get('bills_included'), yes_no),
+                'bathroom': self._label(details.get('bathroom_shared'), self._BATHROOM),
+                'amenities': self._join(details.get('amenities')),
+                'availability_date': room.availability_date
+            })
+            template = self._ROOM_DETAIL_TMPL
+        missing = self._MISSING
+        return template.format_map({key: missing if value is None else value for key, value in flat.items()})
+    
+    @staticmethod
+    def _join(values):
+        """Comma-join a list field, keeping None for a missing one"""
+        return ', '.join(values) if values is not None else None
+    
+    @staticmethod
+    def _label(flag, labels):
+        """Pick the (false, true) label for a flag, keeping None for a missing one"""
+        return labels[bool(flag)] if flag is not None else None
+    
     def display_room(self, room, detailed=False):
         """Print room summary or detailed information"""
-        print(f"\nRoom {room['id']}: {room['name']}")
-        print(f"  Location: {room['location']['city']}, {room['location']['postcode']}")
-        print(f"  Price: £{room['price_per_month_gbp']}/month")
-        print(f"  Languages: {', '.join(room['spoken_languages'])}")
-        if detailed:
-            details = room['details']
-            print(f"  Furnished: {'Yes' if details['furnished'] else 'No'}")
-            print(f"  Shared with: {details['shared_with']} people")
-            print(f"  Live-in landlord: {'Yes' if details['live_in_landlord'] else 'No'}")
-            print(f"  Bills included: {'Yes' if details['bills_included'] else 'No'}")
-            print(f"  Bathroom: {'Shared' if details['bathroom_shared'] else 'Private'}")
-            print(f"  Amenities: {', '.join(details['amenities'])}")
-            print(f"  Available from: {room['availability_date']}")
+        sys.stdout.write(self.format_room(room, detailed))
+    
+    def display_rooms(self, rooms, detailed=False):
+        """Print several rooms with a single write"""
+        sys.stdout.write(''.join([self.format_room(room, detailed) for room in rooms]))
+    
+    def format_application(self, app):
+        """Return a user's application summary as text"""
+        room = app.room or Room.from_json({})
+        missing = self._MISSING
+        status = app.status.upper() if app.status is not None else missing
+        applied_on = app.application_date[:10] if app.application_date is not None else missing
+        text = (f"\nApplication {app.id if app.id is not None else missing} - Status: {status}\n"
+                f"  Room: {room.name if room.name is not None else missing}\n"
+                f"  Location: {room.city if room.city is not None else missing}\n"
+                f"  Price: £{room.price if room.price is not None else missing}/month\n"
+                f"  Applied on: {applied_on}\n")
+        if app.status == 'cancelled' and app.cancelled_date is not None:
+            text += f"  Cancelled on: {app.cancelled_date[:10]}\n"
+        return text
     
     def display_application(self, app):
         """Print a user's application summary"""
-        print(f"\nApplication {app['id']} - Status: {app['status'].upper()}")
-        print(f"  Room: {app['room_details']['name']}")
-        print(f"  Location: {app['room_details']['location']['city']}")
-        print(f"  Price: £{app['room_details']['price_per_month_gbp']}/month")
-        print(f"  Applied on: {app['application_date'][:10]}")
-        if app['status'] == 'cancelled' and 'cancelled_date' in app:
-            print(f"  Cancelled on: {app['cancelled_date'][:10]}")
-
-# ------------------------- Main CLI -------------------------
+        sys.stdout.write(self.format_application(app))
+    
+    def display_applications(self, apps):
+        """Print several applications with a single write"""
+        sys.stdout.write(''.join([self.format_application(app) for app in apps]))
 
-def main():
-    """Main interactive menu for the Global Dorm client"""
-    client = GlobalDormClient()
-    
-    print("Welcome to Global Dorm - Student Accommodation Finder")
-    print("=" * 55)
-    
-    # Demo user credentials
-    user_id = "student123"
-    user_email = "student@example.com"
-    
-    while True:
-        # Display menu
-        print("\nMenu:")
-        print("1. Search all rooms")
-        print("2. Search rooms with filters")
-        print("3. Get room details")
-        print("4. Apply for a room")
-        print("5. View my applications")
-        print("6. Cancel an application")
-        print("7. Check distance to campus")
-        print("8. Get weather forecast")
-        print("9. Exit")
-        
-        choice = input("\nEnter your choice (1-9): ").strip()
-        
-        # Map choices to functions
-        if choice == '1':
-            client.search_rooms()
-        elif choice == '2':
-            print("\nSearch Filters (press Enter to skip):")
-            city = input("City: ").strip()
-            max_price = input("Max price (£): ").strip()
-            furnished = input("Furnished (true/false): ").strip()
-            language = input("Language: ").strip()
-            filters = {}
-            if city: filters['city'] = city
-            if max_price: filters['max_price'] = max_price
-            if furnished: filters['furnished'] = furnished
-            if language: filters['language'] = language
-            client.search_rooms(filters)
-        elif choice == '3':
-            try:
-                room_id = int(input("Enter room ID: ").strip())
-                client.get_room_details(room_id)
-            except ValueError:
-                print("Invalid room ID")
-        elif choice == '4':
+class AsyncGlobalDormClient(GlobalDormClient):
+    """Asyncio client for the Global Dorm service
+    
+    Exposes the same operations as GlobalDormClient as coroutines, so
+    independent requests can be in flight at once. Single requests share one
+    multiplexed HTTP/2 connection (cleartext h2c with prior knowledge) unless
+    http2 is False or the orchestrator turns out not to speak it; streamed
+    lists and the HTTP/1.1 fallback use a pooled aiohttp session.
+    Use as an async context manager: `async with AsyncGlobalDormClient() as client:`
+    """
+    
+    def __init__(self, base_url="http://localhost:8080", http2=True):
+        """Store configuration; the sessions are opened in __aenter__"""
+        self.base_url = base_url.rstrip('/')
+        self.session = None
+        self._http2 = http2
+        self._h2 = None
+        self._use_h2 = False
+        self._h2_confirmed = False
+        self._warm_up_pending = None
+        self._cache = OrderedDict()
+        # Caps in-flight requests so gathered calls don't overwhelm the orchestrator
+        self._semaphore = asyncio.Semaphore(8)
+    
+    # Failures that mean the orchestrator doesn't speak h2c: it rejected or
+    # dropped the HTTP/2 preface. Refused connections and timeouts don't count.
+    _H2_MISMATCH = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+    
+    async def __aenter__(self):
+        """Open the HTTP sessions and check service availability"""
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': self._ACCEPT
+        }
+        self.session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+            # aiohttp advertises br itself when brotli is installed and decodes it natively
+            auto_decompress=True
+        )
+        if self._http2:
+            # HTTP/2 only, no upgrade round trip: the orchestrator accepts h2c directly
+            self._h2 = httpx.AsyncClient(http1=False, http2=True, headers=headers, timeout=10)
+            self._use_h2 = True
+        
+        # Warm up the connection pool as a background task so entering doesn't wait on the network;
+        # the result doubles as the reachability check, reported by the first request
+        self._warm_up_pending = asyncio.create_task(self.warm_up())
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def __enter__(self):
+        # The inherited __exit__ would call close() without awaiting it and leak both sessions
+        raise TypeError("AsyncGlobalDormClient must be used with 'async with', not 'with'")
+    
+    async def close(self):
+        """Close the aiohttp session and its pooled connections"""
+        if self._warm_up_pending is not None:
+            self._warm_up_pending.cancel()
             try:
-                room_id = int(input("Enter room ID to apply for: ").strip())
-                client.apply_for_room(room_id, user_id, user_email)
-            except ValueError:
-                print("Invalid room ID")
-        elif choice == '5':
-            client.get_user_applications(user_id)
-        elif choice == '6':
+                await self._warm_up_pending
+            except asyncio.CancelledError:
+                pass
+            self._warm_up_pending = None
+        if self._h2 is not None:
+            await self._h2.aclose()
+            self._h2 = None
+            self._use_h2 = False
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def test_connection(self):
+        """Check if the orchestrator service is reachable"""
+        try:
+            async with self.session.get(f"{self.base_url}/api/health",
+                                        timeout=aiohttp.ClientTimeout(total=5)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+    
+    async def warm_up(self, connections=None):
+        """Open pooled keep-alive connections ahead of real requests
+        
+        The first probe to connect also fills the connector's DNS cache. With
+        HTTP/2 one more probe opens the shared connection, or finds that the
+        orchestrator doesn't support it. Returns how many probes succeeded;
+        0 means the service is unreachable.
+        """
+        connections = connections or self._WARM_CONNECTIONS
+        probes = [self._probe_connection() for _ in range(connections)]
+        if self._use_h2:
+            probes.append(self._probe_http2())
+        results = await asyncio.gather(*probes)
+        return sum(results)
+    
+    async def _probe_connection(self):
+        """Send a cheap HEAD request to open one pooled connection"""
+        try:
+            async with self.session.head(f"{self.base_url}/api/health",
+                                         timeout=aiohttp.ClientTimeout(total=2)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+    
+    async def _probe_http2(self):
+        """Send a cheap HEAD request to open the shared HTTP/2 connection"""
+        try:
+            response = await self._h2.head(f"{self.base_url}/api/health", timeout=2)
+            self._h2_confirmed = True
+            return response.status_code == 200
+        except self._H2_MISMATCH:
+            self._http2_failed()
+            return False
+        except httpx.HTTPError:
+            return False
+    
+    def _http2_failed(self):
+        """Switch to HTTP/1.1 if HTTP/2 has never worked against this server
+        
+        Returns True if it did switch.
+        """
+        if self._h2_confirmed:
+            return False
+        self._use_h2 = False
+        return True
+    
+    async def _send(self, verb, url, body, params, headers):
+        """Send one request and return (status, response, body bytes)
+        
+        Goes over the shared HTTP/2 connection while it is in use, otherwise
+        through the aiohttp pool. If a fresh HTTP/2 connection is rejected
+        before HTTP/2 ever worked, the orchestrator is taken not to support
+        h2c and the client switches to HTTP/1.1 for the rest of the session.
+        Only a GET is ever resent after such a failure: POST and DELETE stay
+        on HTTP/1.1 until HTTP/2 is confirmed, so a write is never sent twice.
+        """
+        if self._use_h2 and (self._h2_confirmed or verb == 'GET'):
             try:
-                app_id = int(input("Enter application ID to cancel: ").strip())
-                client.cancel_application(app_id, user_id)
-            except ValueError:
-                print("Invalid application ID")
-        elif choice == '7':
-            print("\nDistance Calculator (UK postcodes)")
-            room_postcode = input("Enter room postcode: ").strip()
-            campus_postcode = input("Enter campus postcode: ").strip()
-            if room_postcode and campus_postcode:
-                client.get_distance_to_campus(room_postcode, campus_postcode)
-            else:
-                print("Both postcodes are required")
-        elif choice == '8':
-            print("\nWeather Forecast (UK postcodes)")
-            postcode = input("Enter postcode for weather forecast: ").strip()
-            if postcode:
-                client.get_weather_forecast(postcode)
+                response = await self._h2.request(verb, url, content=body, params=params, headers=headers)
+                self._h2_confirmed = True
+                return response.status_code, response, response.content
+            except self._H2_MISMATCH:
+                if not self._http2_failed():
+                    raise
+        async with self.session.request(verb, url, data=body, params=params, headers=headers,
+                                        timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return response.status, response, await response.read()
+    
+    async def make_request(self, method, endpoint, data=None, params=None):
+        """Generic HTTP request coroutine with error handling"""
+        self._check_warm_up()
+        verb = method.upper()
+        if verb not in ('GET', 'POST', 'DELETE'):
+            print(f"Unsupported HTTP method: {method}")
+            return None
+        
+        cache_key = self._cache_key(endpoint, params) if verb == 'GET' else None
+        stale = None
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            stale = self._cache_validator(cache_key)
+        
+        try:
+            url = f"{self.base_url}{endpoint}"
+            
+            body = orjson.dumps(data) if data is not None else None
+            headers = {'If-None-Match': stale[1]} if stale is not None else None
+            
+            async with self._semaphore:
+                status, response, content = await self._send(verb, url, body, params, headers)
+            if status == 304 and stale is not None:
+                # Unchanged on the server: reuse the cached body without parsing it
+                self._cache_put(cache_key, *stale)
+                return stale[0]
+            result = self._decode(response, content) if content else None
+            if status == 200:
+                if cache_key is not None:
+                    self._cache_put(cache_key, result, response.headers.get('ETag'))
+                return result
             else:
-                print("Postcode is required")
-        elif choice == '9':
-            print("Thank you for using Global Dorm!")
-            break
+                # Attempt to print server-provided error message
+                error_data = result or {}
+                print(f"Request failed ({status}): {error_data.get('message', 'Unknown error')}")
+                return None
+        
+        except (aiohttp.ClientError, httpx.HTTPError, asyncio.TimeoutError) as e:
+            print(f"Network error: {e}")
+            return None
+        except self._DECODE_ERRORS:
+            print("Invalid response from server")
+            return None
+    
+    async def iter_request(self, endpoint, params=None, item_path='item', wrap=None):
+        """Stream a GET response and return an async iterator over the JSON array at item_path
+        
+        wrap is applied to each item as in GlobalDormClient.iter_request.
+        Returns None if the request fails.
+        """
+        self._check_warm_up()
+        cache_key = self._cache_key(endpoint, params) + (item_path, wrap)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._replay(cached)
+        stale = self._cache_validator(cache_key)
+        headers = {**self._STREAM_HEADERS, 'If-None-Match': stale[1]} if stale is not None else self._STREAM_HEADERS
+        
+        # A stream counts against the in-flight cap until its body is fully read
+        await self._semaphore.acquire()
+        streaming = False
+        try:
+            url = f"{self.base_url}{endpoint}"
+            response = await self.session.get(url, params=params, headers=headers,
+                                              timeout=aiohttp.ClientTimeout(total=10))
+            if response.status == 200:
+                # _iter_items now owns the response and the semaphore slot
+                streaming = True
+                return self._iter_items(response, item_path, cache_key, wrap)
+            try:
+                if response.status == 304 and stale is not None:
+                    # Unchanged on the server: replay the cached items
+                    self._cache_put(cache_key, *stale)
+                    return self._replay(stale[0])
+                # Attempt to print server-provided error message
+                content = await response.read()
+                error_data = orjson.loads(content) if content else {}
+                print(f"Request failed ({response.status}): {error_data.get('message', 'Unknown error')}")
+                return None
+            finally:
+                response.release()
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Network error: {e}")
+            return None
+        except orjson.JSONDecodeError:
+            print("Invalid JSON response from server")
+            return None
+        finally:
+            if not streaming:
+                self._semaphore.release()
+    
+    async def _iter_items(self, response, item_path, cache_key, wrap):
+        """Yield array items from a streamed response, caching them once fully read
+        
+        Releases the response and its semaphore slot when the stream ends or the
+        iterator is closed, so callers that stop early should call aclose().
+        """
+        items = []
+        try:
+            async for item in ijson.items(response.content, item_path, use_float=True):
+                if wrap is not None:
+                    item = wrap(item)
+                items.append(item)
+                yield item
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Network error: {e}")
+            return
+        except ijson.JSONError:
+            print("Invalid JSON response from server")
+            return
+        finally:
+            response.release()
+            self._semaphore.release()
+        self._cache_put(cache_key, items, response.headers.get('ETag'))
+    
+    @staticmethod
+    async def _replay(items):
+        """Async iterator over already-parsed items"""
+        for item in items:
+            yield item
+    
+    # ------------------------- Room-related methods -------------------------
+    
+    async def search_rooms(self, filters=None, details=False):
+        """Search for rooms using optional filters, optionally fetching full details in one bulk request"""
+        print("\nSearching for rooms...")
+        # Full details come from the bulk request, so a detailed search only needs ids
+        params = {**(filters or {}), 'fields': 'id' if details else self._ROOM_SUMMARY_FIELDS}
+        rooms = await self.iter_request('/api/rooms', params=params, item_path='rooms.item',
+                                        wrap=Room.from_json)
+        if rooms is None:
+            print("Failed to search rooms")
+            return []
+        if details:
+            room_ids = [room.id async for room in rooms]
+            print(f"Found {len(room_ids)} room(s)")
+            return (await self.get_rooms_bulk(room_ids)) if room_ids else []
+        
+        # Display each room as soon as it is parsed off the stream
+        found = []
+        async for room in rooms:
+            self.display_room(room)
+            found.append(room)
+        print(f"Found {len(found)} room(s)")
+        return found
+    
+    async def get_room_details(self, room_id):
+        """Retrieve detailed info for a specific room"""
+        print(f"\nGetting details for room {room_id}...")
+        response = await self.make_request('GET', f'/api/rooms/{room_id}')
+        return self._on_room_details(response, room_id)
+    
+    async def get_rooms_bulk(self, room_ids):
+        """Retrieve detailed info for several rooms in a single request"""
+        print(f"\nGetting details for {len(room_ids)} room(s)...")
+        response = await self.make_request('POST', '/api/rooms/bulk', data={'ids': room_ids})
+        return self._on_rooms_bulk(response)
+    
+    async def get_rooms_details(self, room_ids):
+        """Retrieve detailed info for several rooms concurrently
+        
+        The requests run together but the rooms are reported in the order given.
+        """
+        responses = await asyncio.gather(*(self.make_request('GET', f'/api/rooms/{room_id}')
+                                           for room_id in room_ids))
+        rooms = []
+        for room_id, response in zip(room_ids, responses):
+            print(f"\nGetting details for room {room_id}...")
+            rooms.append(self._on_room_details(response, room_id))
+        return rooms
+    
+    # ------------------------- Application methods -------------------------
+    
+    async def apply_for_room(self, room_id, user_id, user_email):
+        """Submit an application for a room"""
+        print(f"\nApplying for room {room_id}...")
+        data = {
+            'room_id': room_id,
+            'user_id': user_id,
+            'user_email': user_email
+        }
+        response = await self.make_request('POST', '/api/applications', data=data)
+        self._invalidate_applications(user_id)
+        return self._on_apply_for_room(response)
+    
+    async def apply_for_rooms_bulk(self, applications):
+        """Submit several applications (dicts of room_id, user_id, user_email) in a single request"""
+        print(f"\nApplying for {len(applications)} room(s)...")
+        data = {'applications': applications}
+        response = await self.make_request('POST', '/api/applications/bulk', data=data)
+        self._invalidate_applications(*{application.get('user_id') for application in applications})
+        return self._on_apply_for_rooms_bulk(response, applications)
+    
+    async def cancel_application(self, application_id, user_id):
+        """Cancel an existing room application"""
+        print(f"\nCancelling application {application_id}...")
+        data = {'user_id': user_id}
+        response = await self.make_request('DELETE', f'/api/applications/{application_id}', data=data)
+        self._invalidate_applications(user_id)
+        return self._on_cancel_application(response)
+    
+    async def get_user_applications(self, user_id):
+        """Retrieve all applications submitted by a user"""
+        print(f"\nGetting applications for user {user_id}...")
+        return self._on_user_applications(await self._fetch_user_applications(user_id))
+    
+    async def _fetch_user_applications(self, user_id):
+        """Read a user's streamed applications into a list (None if the request fails)"""
+        params = {'fields': self._APPLICATION_SUMMARY_FIELDS}
+        applications = await self.iter_request(f'/api/users/{user_id}/applications', params=params,
+                                               item_path='applications.item', wrap=Application.from_json)
+        if applications is None:
+            return None
+        return [app async for app in applications]
+    
+    # ------------------------- External service methods -------------------------
+    
+    async def get_distance_to_campus(self, room_postcode, campus_postcode):
+        """Retrieve driving distance and duration from room to campus"""
+        print(f"\nCalculating distance from {room_postcode} to {campus_postcode}...")
+        params = {'room_postcode': room_postcode, 'campus_postcode': campus_postcode}
+        response = await self.make_request('GET', '/api/distance', params=params)
+        return self._on_distance(response)
+    
+    async def get_weather_forecast(self, postcode):
+        """Retrieve weather forecast for a given postcode"""
+        print(f"\nGetting weather forecast for {postcode}...")
+        params = {'postcode': postcode}
+        response = await self.make_request('GET', '/api/weather', params=params)
+        return self._on_weather(response)
+
+    async def dashboard(self, user_id, room_postcode, campus_postcode):
+        """Fetch a user's applications, distance to campus and weather concurrently
+        
+        The responses are gathered first and reported afterwards in a fixed
+        order, so each section's output stays together.
+        """
+        apps, dist, weather = await asyncio.gather(
+            self._fetch_user_applications(user_id),
+            self.make_request('GET', '/api/distance',
+                              params={'room_postcode': room_postcode, 'campus_postcode': campus_postcode}),
+            self.make_request('GET', '/api/weather', params={'postcode': room_postcode})
+        )
+        print(f"\nGetting applications for user {user_id}...")
+        apps = self._on_user_applications(apps)
+        print(f"\nCalculating distance from {room_postcode} to {campus_postcode}...")
+        dist = self._on_distance(dist)
+        print(f"\nGetting weather forecast for {room_postcode}...")
+        weather = self._on_weather(weather)
+        return {'applications': apps, 'distance': dist, 'weather': weather}
+
+# ------------------------- Background agent -------------------------
+
+def agent_socket_path():
+    """Return the Unix socket path the background agent (agentd.py) listens on"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'globaldormd.sock')
+    return os.path.join(tempfile.gettempdir(), f'globaldormd-{getpass.getuser()}.sock')
+
+class AgentProxy:
+    """Stand-in for AsyncGlobalDormClient that forwards calls to a running agentd.py
+    
+    The agent keeps one warm client (connection pool, DNS and response cache)
+    alive across CLI runs; each call returns the result and the text the
+    agent's client printed, which is relayed to stdout here.
+    """
+    
+    # Client coroutines the agent will run on request
+    OPS = frozenset({
+        'search_rooms', 'get_room_details', 'get_rooms_bulk', 'get_rooms_details',
+        'apply_for_room', 'apply_for_rooms_bulk', 'cancel_application', 'get_user_applications',
+        'get_distance_to_campus', 'get_weather_forecast', 'dashboard'
+    })
+    
+    # Rebuild the Room and Application objects an operation returns from the agent's JSON reply
+    _RESULT_DECODERS = {
+        'search_rooms': lambda rooms: [Room.from_json(room) for room in rooms],
+        'get_room_details': Room.from_json,
+        'get_rooms_bulk': lambda rooms: [Room.from_json(room) for room in rooms],
+        'get_rooms_details': lambda rooms: [Room.from_json(room) if room is not None else None
+                                            for room in rooms],
+        'get_user_applications': lambda apps: [Application.from_json(app) for app in apps],
+        'dashboard': lambda overview: {
+            **overview, 'applications': [Application.from_json(app) for app in overview['applications']]
+        }
+    }
+    
+    def __init__(self, sock_path):
+        self.sock_path = sock_path
+    
+    @staticmethod
+    def available(sock_path):
+        """Check whether an agent of this user is accepting connections on sock_path
+        
+        The fallback path sits in the shared temp directory, so a socket another
+        user created there first is never trusted.
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            return False
+        try:
+            info = os.stat(sock_path)
+        except OSError:
+            return False
+        if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+            return False
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(sock_path)
+            return True
+        except OSError:
+            return False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+    
+    async def call(self, op, *args, **kwargs):
+        """Run one client operation in the agent and relay its output"""
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.sock_path)
+            try:
+                writer.write(orjson.dumps({'op': op, 'args': args, 'kwargs': kwargs}))
+                writer.write_eof()
+                reply = orjson.loads(await reader.read())
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"Agent error: {e}")
+            return None
+        
+        sys.stdout.write(reply.get('output', ''))
+        if 'error' in reply:
+            print(f"Agent error: {reply['error']}")
+            return None
+        result = reply.get('result')
+        decode = self._RESULT_DECODERS.get(op)
+        return decode(result) if decode is not None and result is not None else result
+    
+    def __getattr__(self, op):
+        if op not in self.OPS:
+            raise AttributeError(op)
+        return functools.partial(self.call, op)
+
+# ------------------------- Search filters -------------------------
+
+# Filters GET /api/rooms accepts, in menu order, with their prompts
+_FILTER_FIELDS = (
+    ('city', "City: "),
+    ('max_price', "Max price (£): "),
+    ('furnished', "Furnished (true/false): "),
+    ('language', "Language: "),
+)
+
+def _compile_filter_builder(fields):
+    """Generate a build_filters(values) function specialised to the given filter names
+    
+    The generated body has one straight-line check per field, so adding a
+    filter only means adding it to _FILTER_FIELDS.
+    """
+    source = "def build_filters(values):\n    filters = {}\n"
+    for name in fields:
+        source += f"    value = values.get({name!r})\n    if value: filters[{name!r}] = value\n"
+    source += "    return filters\n"
+    namespace = {}
+    exec(compile(source, '<build_filters>', 'exec'), namespace)
+    return namespace['build_filters']
+
+build_filters = _compile_filter_builder(name for name, _ in _FILTER_FIELDS)
+
+# ------------------------- Main CLI -------------------------
+
+async def ainput(prompt=''):
+    """Read a line like input() without blocking the event loop
+    
+    Background tasks such as the client's warm-up keep running while the user
+    types. The read runs on a daemon thread so Ctrl+C still exits immediately.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(line, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
         else:
-            print("Invalid choice. Please try again.")
+            future.set_result(line)
+    
+    def read():
+        try:
+            line, error = input(prompt), None
+        except (EOFError, KeyboardInterrupt) as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(deliver, line, error)
+        except RuntimeError:
+            # The loop closed while waiting for input
+            pass
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def main():
+    """Main interactive menu for the Global Dorm client"""
+    # Reuse the background agent's warm client when one is running
+    sock_path = agent_socket_path()
+    client = AgentProxy(sock_path) if AgentProxy.available(sock_path) else AsyncGlobalDormClient()
+    
+    async with client:
+        print("Welcome to Global Dorm - Student Accommodation Finder")
+        print("=" * 55)
+    
+        # Demo user credentials
+        user_id = "student123"
+        user_email = "student@example.com"
+    
+        while True:
+            # Display menu
+            print("\nMenu:")
+            print("0. Overview (applications, distance and weather)")
+            print("1. Search all rooms")
+            print("2. Search rooms with filters")
+            print("3. Get room details")
+            print("4. Apply for a room")
+            print("5. View my applications")
+            print("6. Cancel an application")
+            print("7. Check distance to campus")
+            print("8. Get weather forecast")
+            print("9. Exit")
+        
+            choice = (await ainput("\nEnter your choice (0-9): ")).strip()
+        
+            # Map choices to functions
+            if choice == '0':
+                print("\nOverview (UK postcodes)")
+                room_postcode = (await ainput("Enter room postcode: ")).strip()
+                campus_postcode = (await ainput("Enter campus postcode: ")).strip()
+                if room_postcode and campus_postcode:
+                    await client.dashboard(user_id, room_postcode, campus_postcode)
+                else:
+                    print("Both postcodes are required")
+            elif choice == '1':
+                await client.search_rooms()
+            elif choice == '2':
+                print("\nSearch Filters (press Enter to skip):")
+                values = {name: (await ainput(prompt)).strip() for name, prompt in _FILTER_FIELDS}
+                details = (await ainput("Show full details (y/n): ")).strip().lower() == 'y'
+                await client.search_rooms(build_filters(values), details=details)
+            elif choice == '3':
+                try:
+                    room_id = int((await ainput("Enter room ID: ")).strip())
+                    await client.get_room_details(room_id)
+                except ValueError:
+                    print("Invalid room ID")
+            elif choice == '4':
+                try:
+                    room_id = int((await ainput("Enter room ID to apply for: ")).strip())
+                    await client.apply_for_room(room_id, user_id, user_email)
+                except ValueError:
+                    print("Invalid room ID")
+            elif choice == '5':
+                await client.get_user_applications(user_id)
+            elif choice == '6':
+                try:
+                    app_id = int((await ainput("Enter application ID to cancel: ")).strip())
+                    await client.cancel_application(app_id, user_id)
+                except ValueError:
+                    print("Invalid application ID")
+            elif choice == '7':
+                print("\nDistance Calculator (UK postcodes)")
+                room_postcode = (await ainput("Enter room postcode: ")).strip()
+                campus_postcode = (await ainput("Enter campus postcode: ")).strip()
+                if room_postcode and campus_postcode:
+                    await client.get_distance_to_campus(room_postcode, campus_postcode)
+                else:
+                    print("Both postcodes are required")
+            elif choice == '8':
+                print("\nWeather Forecast (UK postcodes)")
+                postcode = (await ainput("Enter postcode for weather forecast: ")).strip()
+                if postcode:
+                    await client.get_weather_forecast(postcode)
+                else:
+                    print("Postcode is required")
+            elif choice == '9':
+                print("Thank you for using Global Dorm!")
+                break
+            else:
+                print("Invalid choice. Please try again.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # An ainput thread may still be blocked on stdin; skip the interpreter
+        # teardown, which would fail trying to take its lock
+        print()
+        sys.stdout.flush()
+        os._exit(130)
@@ -1,10 +1,20 @@
 package com.globaldorm.orchestrator;
 
+import com.fasterxml.jackson.databind.ObjectMapper;
+import org.msgpack.jackson.dataformat.MessagePackFactory;
 import org.springframework.boot.SpringApplication;
 import org.springframework.boot.autoconfigure.SpringBootApplication;
+import org.springframework.boot.web.servlet.FilterRegistrationBean;
 import org.springframework.boot.web.servlet.support.SpringBootServletInitializer;
 import org.springframework.context.annotation.Bean;
+import org.springframework.http.MediaType;
+import org.springframework.http.converter.HttpMessageConverter;
+import org.springframework.http.converter.json.AbstractJackson2HttpMessageConverter;
 import org.springframework.web.client.RestTemplate;
+import org.springframework.web.filter.ShallowEtagHeaderFilter;
+import org.springframework.web.servlet.config.annotation.WebMvcConfigurer;
+
+import java.util.List;
 
 /**
  * Main Spring Boot application class for Global Dorm Orchestrator
@@ -32,4 +42,41 @@ public class GlobalDormOrchestrator extends SpringBootServletInitializer {
 	public RestTemplate restTemplate() {
 		return new RestTemplate();
 	}
+
+	/**
+	 * Bean configuration for ETag support on API responses
+	 * Adds an ETag hashed from each response body and answers matching
+	 * If-None-Match requests with 304 Not Modified and no body.
+	 * Weak ETags stay valid when responses are gzip-compressed.
+	 * 
+	 * @return Filter registration covering all /api endpoints
+	 */
+	@Bean
+	public FilterRegistrationBean<ShallowEtagHeaderFilter> etagFilter() {
+		ShallowEtagHeaderFilter filter = new ShallowEtagHeaderFilter();
+		filter.setWriteWeakETag(true);
+		FilterRegistrationBean<ShallowEtagHeaderFilter> registration = new FilterRegistrationBean<>(filter);
+		registration.addUrlPatterns("/api/*");
+		return registration;
+	}
+
+	/**
+	 * Bean configuration for MessagePack responses
+	 * Clients that send Accept: application/msgpack receive the same response
+	 * bodies encoded as binary MessagePack instead of JSON. The converter is
+	 * appended after the JSON one, so clients that accept any type still get JSON.
+	 * 
+	 * @return MVC configurer registering the MessagePack converter
+	 */
+	@Bean
+	public WebMvcConfigurer messagePackConfigurer() {
+		return new WebMvcConfigurer() {
+			@Override
+			public void extendMessageConverters(List<HttpMessageConverter<?>> converters) {
+				converters.add(new AbstractJackson2HttpMessageConverter(
+						new ObjectMapper(new MessagePackFactory()), new MediaType("application", "msgpack")) {
+				});
+			}
+		};
+	}
 }
\ No newline at end of file
@@ -1,5 +1,8 @@
 package com.globaldorm.orchestrator.controller;
 
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.fasterxml.jackson.databind.node.ObjectNode;
 import com.globaldorm.orchestrator.model.Room;
 import com.globaldorm.orchestrator.model.Application;
 import com.globaldorm.orchestrator.service.ApplicationService;
@@ -11,6 +14,7 @@ import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
 
 import java.time.LocalDateTime;
+import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
@@ -37,15 +41,20 @@ public class OrchestratorController {
     @Autowired
     private ExternalApiService externalApiService;
 
+    // Used to convert models to JSON trees for field projection
+    private final ObjectMapper objectMapper = new ObjectMapper();
+
     /**
      * Search and filter rooms endpoint
      * Supports multiple optional query parameters for filtering
-     * GET /api/rooms?city=X&max_price=Y&furnished=true&language=Z
+     * GET /api/rooms?city=X&max_price=Y&furnished=true&language=Z&fields=id,name
      * 
      * @param city      Optional city filter (case-insensitive)
      * @param max_price Optional maximum price filter in GBP
      * @param furnished Optional furnished status filter (true/false)
      * @param language  Optional spoken language filter
+     * @param fields    Optional comma-separated fields to return per room, with
+     *                  dots for nested fields (e.g. location.city)
      * @return ResponseEntity with JSON containing filtered rooms list and metadata
      */
     @GetMapping("/rooms")
@@ -53,7 +62,8 @@ public class OrchestratorController {
             @RequestParam(required = false) String city,
             @RequestParam(required = false) String max_price,
             @RequestParam(required = false) String furnished,
-            @RequestParam(required = false) String language) {
+            @RequestParam(required = false) String language,
+            @RequestParam(required = false) String fields) {
 
         try {
             // Delegate to room service for business logic
@@ -62,7 +72,7 @@ public class OrchestratorController {
             // Build successful response with metadata
             Map<String, Object> response = new HashMap<>();
             response.put("success", true);
-            response.put("rooms", rooms);
+            response.put("rooms", projectFields(rooms, fields));
             response.put("total", rooms.size());
 
             return ResponseEntity.ok(response);
@@ -106,6 +116,49 @@ public class OrchestratorController {
         }
     }
 
+    /**
+     * Bulk room details endpoint
+     * Returns details for several rooms in a single round trip
+     * POST /api/rooms/bulk
+     * Expected JSON body: {"ids": [1, 2, 3]}
+     * 
+     * @param requestData JSON request body with the list of room IDs
+     * @return ResponseEntity with the rooms found, in request order
+     */
+    @PostMapping("/rooms/bulk")
+    public ResponseEntity<Map<String, Object>> getRoomsBulk(@RequestBody Map<String, Object> requestData) {
+        try {
+            if (!(requestData.get("ids") instanceof List)) {
+                Map<String, Object> response = new HashMap<>();
+                response.put("success", false);
+                response.put("message", "Missing required field: ids");
+                return ResponseEntity.badRequest().body(response);
+            }
+
+            List<Integer> roomIds = new ArrayList<>();
+            for (Object id : (List<?>) requestData.get("ids")) {
+                roomIds.add((Integer) id);
+            }
+            List<Room> rooms = roomService.getRoomsByIds(roomIds);
+
+            Map<String, Object> response = new HashMap<>();
+            response.put("success", true);
+            response.put("rooms", rooms);
+            response.put("total", rooms.size());
+            return ResponseEntity.ok(response);
+        } catch (ClassCastException e) {
+            // Handle non-integer room IDs
+            Map<String, Object> response = new HashMap<>();
+            response.put("success", false);
+            response.put("message", "Invalid data format in request");
+            return ResponseEntity.badRequest().body(response);
+        } catch (Exception e) {
+            Map<String, Object> errorResponse = new HashMap<>();
+            errorResponse.put("error", "Internal server error");
+            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(errorResponse);
+        }
+    }
+
     /**
      * Create room application endpoint
      * Accepts JSON payload with application details
@@ -119,16 +172,92 @@ public class OrchestratorController {
     @PostMapping("/applications")
     public ResponseEntity<Map<String, Object>> applyForRoom(@RequestBody Map<String, Object> requestData) {
         try {
-            // Validate all required fields are present
-            if (!requestData.containsKey("room_id") ||
-                    !requestData.containsKey("user_id") ||
-                    !requestData.containsKey("user_email")) {
+            Map<String, Object> response = submitApplication(requestData);
+
+            // Return appropriate HTTP status code
+            HttpStatus status = Boolean.TRUE.equals(response.get("success")) ? HttpStatus.OK : HttpStatus.BAD_REQUEST;
+            return ResponseEntity.status(status).body(response);
+        } catch (Exception e) {
+            Map<String, Object> errorResponse = new HashMap<>();
+            errorResponse.put("error", "Internal server error");
+            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(errorResponse);
+        }
+    }
+
+    /**
+     * Bulk room application endpoint
+     * Submits several applications in a single round trip
+     * POST /api/applications/bulk
+     * Expected JSON body: {"applications": [{"room_id": 1, "user_id":
+     * "student123", "user_email": "student@example.com"}, ...]}
+     * 
+     * @param requestData JSON request body with the list of applications
+     * @return ResponseEntity with one result per application, in request order
+     */
+    @PostMapping("/applications/bulk")
+    public ResponseEntity<Map<String, Object>> applyForRoomsBulk(@RequestBody Map<String, Object> requestData) {
+        try {
+            if (!(requestData.get("applications") instanceof List)) {
                 Map<String, Object> response = new HashMap<>();
                 response.put("success", false);
-                response.put("message", "Missing required fields: room_id, user_id, user_email");
+                response.put("message", "Missing required field: applications");
                 return ResponseEntity.badRequest().body(response);
             }
 
+            // Each application succeeds or fails independently; earlier ones are
+            // already saved, so a failure is reported per item, never for the batch
+            List<Map<String, Object>> results = new ArrayList<>();
+            for (Object item : (List<?>) requestData.get("applications")) {
+                if (item instanceof Map) {
+                    @SuppressWarnings("unchecked")
+                    Map<String, Object> applicationData = (Map<String, Object>) item;
+                    try {
+                        results.add(submitApplication(applicationData));
+                    } catch (Exception e) {
+                        Map<String, Object> result = new HashMap<>();
+                        result.put("success", false);
+                        result.put("message", "Failed to submit application");
+                        results.add(result);
+                    }
+                } else {
+                    Map<String, Object> result = new HashMap<>();
+                    result.put("success", false);
+                    result.put("message", "Invalid data format in request");
+                    results.add(result);
+                }
+            }
+
+            Map<String, Object> response = new HashMap<>();
+            response.put("success", true);
+            response.put("results", results);
+            response.put("total", results.size());
+            return ResponseEntity.ok(response);
+        } catch (Exception e) {
+            Map<String, Object> errorResponse = new HashMap<>();
+            errorResponse.put("error", "Internal server error");
+            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(errorResponse);
+        }
+    }
+
+    /**
+     * Validate and submit a single room application
+     * Shared by the single and bulk application endpoints
+     * 
+     * @param requestData Application details: room_id, user_id, user_email
+     * @return Response body with success flag, message and application ID
+     */
+    private Map<String, Object> submitApplication(Map<String, Object> requestData) {
+        try {
+            // Validate all required fields are present and not null
+            if (requestData.get("room_id") == null ||
+                    requestData.get("user_id") == null ||
+                    requestData.get("user_email") == null) {
+                Map<String, Object> response = new HashMap<>();
+                response.put("success", false);
+                response.put("message", "Missing required fields: room_id, user_id, user_email");
+                return response;
+            }
+
             // Extract and validate request data
             int roomId = (Integer) requestData.get("room_id");
             String userId = (String) requestData.get("user_id");
@@ -140,7 +269,7 @@ public class OrchestratorController {
                 Map<String, Object> response = new HashMap<>();
                 response.put("success", false);
                 response.put("message", "Room not found");
-                return ResponseEntity.badRequest().body(response);
+                return response;
             }
 
             // Process application through service layer
@@ -154,21 +283,14 @@ public class OrchestratorController {
             if (result.isSuccess()) {
                 response.put("application_id", result.getApplicationId());
             }
-
-            // Return appropriate HTTP status code
-            HttpStatus status = result.isSuccess() ? HttpStatus.OK : HttpStatus.BAD_REQUEST;
-            return ResponseEntity.status(status).body(response);
+            return response;
 
         } catch (ClassCastException e) {
             // Handle invalid data type in request
             Map<String, Object> response = new HashMap<>();
             response.put("success", false);
             response.put("message", "Invalid data format in request");
-            return ResponseEntity.badRequest().body(response);
-        } catch (Exception e) {
-            Map<String, Object> errorResponse = new HashMap<>();
-            errorResponse.put("error", "Internal server error");
-            return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(errorResponse);
+            return response;
         }
     }
 
@@ -219,13 +341,17 @@ public class OrchestratorController {
     /**
      * Get user applications history endpoint
      * Returns all applications for a specific user, sorted by date
-     * GET /api/users/{userId}/applications
+     * GET /api/users/{userId}/applications?fields=id,status
      * 
      * @param userId User identifier from URL path
+     * @param fields Optional comma-separated fields to return per application,
+     *               with dots for nested fields (e.g. room_details.name)
      * @return ResponseEntity with user's complete application history
      */
     @GetMapping("/users/{userId}/applications")
-    public ResponseEntity<Map<String, Object>> getUserApplications(@PathVariable String userId) {
+    public ResponseEntity<Map<String, Object>> getUserApplications(
+            @PathVariable String userId,
+            @RequestParam(required = false) String fields) {
         try {
             // Retrieve applications through service layer
             List<Application> applications = applicationService.getUserApplications(userId);
@@ -233,7 +359,7 @@ public class OrchestratorController {
             // Build response with applications and metadata
             Map<String, Object> response = new HashMap<>();
             response.put("success", true);
-            response.put("applications", applications);
+            response.put("applications", projectFields(applications, fields));
             response.put("total", applications.size());
 
             return ResponseEntity.ok(response);
@@ -386,4 +512,58 @@ public class OrchestratorController {
             return ResponseEntity.status(HttpStatus.SERVICE_UNAVAILABLE).body(response);
         }
     }
+
+    /**
+     * Reduce each item to the requested fields
+     * Lets clients ask only for the fields they display, shrinking responses
+     * 
+     * @param items  Models to serialise
+     * @param fields Comma-separated field paths (dots for nesting), or null for
+     *               all fields
+     * @return The items unchanged if no fields were requested, otherwise one
+     *         JSON object per item containing only the requested fields
+     */
+    private List<?> projectFields(List<?> items, String fields) {
+        if (fields == null || fields.isBlank()) {
+            return items;
+        }
+
+        List<String[]> paths = new ArrayList<>();
+        for (String field : fields.split(",")) {
+            if (!field.isBlank()) {
+                paths.add(field.trim().split("\\."));
+            }
+        }
+
+        List<JsonNode> projected = new ArrayList<>();
+        for (Object item : items) {
+            JsonNode source = objectMapper.valueToTree(item);
+            ObjectNode target = objectMapper.createObjectNode();
+            for (String[] path : paths) {
+                copyPath(source, target, path, 0);
+            }
+            projected.add(target);
+        }
+        return projected;
+    }
+
+    /**
+     * Copy one dotted field path from source to target, creating nested objects
+     * as needed. Missing fields are skipped.
+     */
+    private void copyPath(JsonNode source, ObjectNode target, String[] path, int depth) {
+        JsonNode value = source.get(path[depth]);
+        if (value == null) {
+            return;
+        }
+        if (depth == path.length - 1) {
+            target.set(path[depth], value);
+            return;
+        }
+        if (value.isObject()) {
+            JsonNode existing = target.get(path[depth]);
+            ObjectNode child = existing instanceof ObjectNode ? (ObjectNode) existing : target.putObject(path[depth]);
+            copyPath(value, child, path, depth + 1);
+        }
+    }
 }
\ No newline at end of file
@@ -11,6 +11,8 @@ import java.io.File;
 import java.io.IOException;
 import java.util.ArrayList;
 import java.util.List;
+import java.util.Map;
+import java.util.Objects;
 import java.util.stream.Collectors;
 
 /**
@@ -124,6 +126,22 @@ public class RoomService {
                 .orElse(null);
     }
 
+    /**
+     * Find several rooms by ID in one pass
+     * Unknown IDs are skipped; results keep the order of the requested IDs
+     * 
+     * @param roomIds The room IDs to look up
+     * @return List of rooms found
+     */
+    public List<Room> getRoomsByIds(List<Integer> roomIds) {
+        Map<Integer, Room> roomsById = rooms.stream()
+                .collect(Collectors.toMap(Room::getId, room -> room, (first, second) -> first));
+        return roomIds.stream()
+                .map(roomsById::get)
+                .filter(Objects::nonNull)
+                .collect(Collectors.toList());
+    }
+
     /**
      * Get total number of available rooms
      * 